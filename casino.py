@@ -1,7 +1,9 @@
 import pygame
-import random
-from typing import List, Dict, Tuple
+import numpy as np
+from numba import njit, prange, get_num_threads
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from collections import OrderedDict
 import math
 
 pygame.init()
@@ -17,6 +19,146 @@ RED = (220, 20, 60)
 GOLD = (255, 215, 0)
 BLUE = (30, 144, 255)
 GRAY = (128, 128, 128)
+OUTCOME_COLOR = {"bust": RED, "win": GOLD, "push": BLUE, "lose": RED}
+
+# Card faces, indexed by the rank/suit codes stored in the shoe arrays
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('♠', '♥', '♦', '♣')
+RANK_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+
+# One 52-card deck, suit by suit; shoes are built by tiling these
+TEMPLATE_RANKS = np.tile(np.arange(len(RANKS), dtype=np.uint8), len(SUITS))
+TEMPLATE_SUITS = np.repeat(np.arange(len(SUITS), dtype=np.uint8), len(RANKS))
+TEMPLATE_VALS = np.array(RANK_VALUES, dtype=np.int8)[TEMPLATE_RANKS]
+
+# Basic strategy, indexed by [player total (or pair card value), dealer up card value]
+ACTIONS = ("Hit", "Stand", "Split", "Consider odds")
+HIT, STAND, SPLIT, CONSIDER = range(len(ACTIONS))
+HARD_STRAT = np.full((22, 12), HIT, dtype=np.uint8)
+HARD_STRAT[17:] = STAND
+HARD_STRAT[12:17, :7] = STAND
+SOFT_STRAT = np.full((22, 12), HIT, dtype=np.uint8)
+SOFT_STRAT[19:] = STAND
+SOFT_STRAT[18, :9] = STAND
+PAIR_STRAT = np.full((12, 12), HIT, dtype=np.uint8)
+PAIR_STRAT[[8, 11]] = SPLIT
+PAIR_STRAT[9] = CONSIDER
+PAIR_STRAT[10] = STAND
+
+# Monte Carlo settings
+SIMULATIONS = 1000
+OUTCOMES = ("bust", "win", "push", "lose")
+BUST, WIN, PUSH, LOSE = range(len(OUTCOMES))
+
+# Rendered dynamic strings (credits, counts, percentages) kept between frames
+TEXT_CACHE_SIZE = 256
+
+# Best hand total indexed by (sum of non-ace cards, number of aces): every ace
+# counts 1 and one of them is upgraded to 11 if that stays at 21 or under.
+# In play a hand stops taking cards once it passes 21, so the non-ace sum
+# stays within 31 and there are at most 22 aces; lookup_total clamps anything
+# larger into the last row/column, which is already a bust.
+HAND_TBL = np.fromfunction(
+    lambda s, a: np.where((a > 0) & (s + a + 10 <= 21), s + a + 10, s + a), (32, 23), dtype=np.int16
+).astype(np.int8)
+
+@njit(cache=True)
+def lookup_total(non_ace, aces):
+    """Best total for a hand; busted hands past the table edge report a capped bust total"""
+    return HAND_TBL[min(non_ace, HAND_TBL.shape[0] - 1), min(aces, HAND_TBL.shape[1] - 1)]
+
+@njit(cache=True)
+def hand_value(vals):
+    """Best total for an array of card point values (aces stored as 11)"""
+    aces = vals == 11
+    return lookup_total(vals[~aces].sum(), aces.sum())
+
+@njit(cache=True)
+def mix64(z):
+    """splitmix64 finaliser: scramble a 64-bit counter into a random-looking word"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+@njit(cache=True)
+def next_uniform(state):
+    """Advance a splitmix64 stream, returning the new state and a float in [0, 1)"""
+    state = state + np.uint64(0x9E3779B97F4A7C15)
+    return state, (mix64(state) >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+@njit(cache=True)
+def draw_value(cdf, state):
+    """Deal a card from a shoe given as a cumulative count per value 2..11.
+    
+    The card is removed from cdf in place; returns the new state and the value.
+    """
+    state, u = next_uniform(state)
+    idx = np.searchsorted(cdf, int(u * cdf[-1]), side='right')
+    cdf[idx:] -= 1
+    return state, idx + 2
+
+@njit(cache=True)
+def play_hand(player_base, player_aces, dealer_base, dealer_aces, cdf, player_hits, state):
+    """Play out one hand from the given random stream and return its outcome code.
+    
+    Cards are dealt without replacement from cdf, which is consumed.
+    """
+    non_ace = player_base
+    aces = player_aces
+    if player_hits and cdf[-1] > 0:
+        # Simulate drawing one more card
+        state, value = draw_value(cdf, state)
+        if value == 11:
+            aces += 1
+        else:
+            non_ace += value
+    player_value = lookup_total(non_ace, aces)
+    
+    if player_value > 21:
+        return BUST
+        
+    # Simulate dealer's hand
+    non_ace = dealer_base
+    aces = dealer_aces
+    dealer_value = lookup_total(non_ace, aces)
+    while dealer_value < 17 and cdf[-1] > 0:
+        state, value = draw_value(cdf, state)
+        if value == 11:
+            aces += 1
+        else:
+            non_ace += value
+        dealer_value = lookup_total(non_ace, aces)
+        
+    if dealer_value > 21 or player_value > dealer_value:
+        return WIN
+    elif player_value == dealer_value:
+        return PUSH
+    return LOSE
+
+@njit(parallel=True, cache=True)
+def simulate_mc(player_base, player_aces, dealer_base, dealer_aces, comp, n_sim, player_hits, seed, n_chunks):
+    """Play out n_sim hands and count the outcomes, indexed by BUST/WIN/PUSH/LOSE.
+    
+    comp holds the number of cards left in the shoe for each value 2..11.
+    n_chunks is normally the Numba thread count; it is passed in because
+    reading it inside the kernel stops Numba from caching the compiled code.
+    """
+    cdf = np.cumsum(comp.astype(np.int64))
+    
+    # Each thread tallies a strided slice of the simulations into its own row.
+    # Simulation i always uses the stream derived from (seed, i), so the result
+    # does not depend on the thread count or scheduling.
+    tallies = np.zeros((n_chunks, len(OUTCOMES)), dtype=np.int64)
+    for chunk in prange(n_chunks):
+        counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+        shoe = np.empty_like(cdf)
+        for i in range(chunk, n_sim, n_chunks):
+            shoe[:] = cdf
+            state = mix64(np.uint64(seed) ^ mix64(np.uint64(i)))
+            counts[play_hand(player_base, player_aces, dealer_base, dealer_aces, shoe, player_hits, state)] += 1
+        tallies[chunk] = counts
+        
+    return tallies.sum(axis=0)
 
 @dataclass
 class Card:
@@ -36,9 +178,16 @@ class BlackjackTeacher:
         # Game state
         self.credits = 1000
         self.bet = 100
-        self.deck = []
+        # The shoe is stored as parallel arrays; cards [0, deck_top) are still undealt
+        self.deck_vals = np.empty(0, dtype=np.int8)
+        self.deck_ranks = np.empty(0, dtype=np.uint8)
+        self.deck_suits = np.empty(0, dtype=np.uint8)
+        self.deck_top = 0
+        self.deck_comp = np.zeros(10, dtype=np.int16)  # cards left per value 2..11
         self.player_hand = []
         self.dealer_hand = []
+        self._player_value = None  # cached hand totals, reset whenever a hand changes
+        self._dealer_value = None
         self.game_state = "betting"  # betting, playing, dealer_turn, game_over
         
         # Probability tracking
@@ -48,214 +197,243 @@ class BlackjackTeacher:
         self.probability_breakdown = {}
         self.optimal_action = ""
         self.last_simulation_results = []
+        self._rng = np.random.default_rng()
+        self._outcome_cache = {}
+        self._cached_probs = None
+        
+        # The screen is only redrawn after something changes, and the
+        # probability panel is redrawn off-screen only when the game changes
+        self._dirty = True
+        self._panel_surface = None
+        self._bars_surface = None
+        self._bars_probs = None  # outcome probabilities currently drawn on _bars_surface
+        # Card probability grid, split into two columns after 5 items; offsets
+        # are from the top-left of the section since it moves with the hand
+        col_width = 200
+        self._card_prob_offsets = [(30 + (i // 5) * col_width, (i % 5) * 30) for i in range(10)]
+        self._panel_dirty = True
+        
+        # Rendered text surfaces, keyed by (text, color, font). Static labels are
+        # pre-rendered and kept for good; everything else goes through a
+        # least-recently-used cache so long sessions don't grow it without bound
+        self._static_text = {}
+        self._text_cache = OrderedDict()
+        static_labels = [(f"{rank}{suit}", WHITE) for rank in RANKS for suit in SUITS]
+        static_labels.append(("??", WHITE))
+        for title in ("Probability Analysis", "Recommended Action", "Next Card Probabilities"):
+            static_labels.append((title, GOLD))
+        for label in ("Dealer's Hand", "Your Hand", *(outcome.capitalize() for outcome in OUTCOMES)):
+            static_labels.append((label, WHITE))
+        for text, color in static_labels:
+            self._static_text[(text, color, self.font)] = self.font.render(text, True, color)
         
         self.create_deck()
         
+    def _text(self, text: str, color: Tuple[int, int, int], font: Optional[pygame.font.Font] = None) -> pygame.Surface:
+        """Render text once and reuse the surface on later frames"""
+        font = font or self.font
+        key = (text, color, font)
+        surface = self._static_text.get(key)
+        if surface is not None:
+            return surface
+            
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+        
     def create_deck(self, num_decks: int = 6):
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        suits = ['♠', '♥', '♦', '♣']
-        
-        for _ in range(num_decks):
-            for suit in suits:
-                for rank in ranks:
-                    value = 0
-                    if rank == 'A':
-                        value = 11
-                    elif rank in ['K', 'Q', 'J']:
-                        value = 10
-                    else:
-                        value = int(rank)
-                    self.deck.append(Card(rank, suit, value))
-        
-        random.shuffle(self.deck)
+        perm = self._rng.permutation(num_decks * len(TEMPLATE_VALS))
+        self.deck_vals = np.tile(TEMPLATE_VALS, num_decks)[perm]
+        self.deck_ranks = np.tile(TEMPLATE_RANKS, num_decks)[perm]
+        self.deck_suits = np.tile(TEMPLATE_SUITS, num_decks)[perm]
+        self.deck_top = len(perm)
+        self.deck_comp = np.bincount(self.deck_vals - 2, minlength=10).astype(np.int16)
+        self._outcome_cache.clear()
+        self._cached_probs = None
         
     def calculate_hand_value(self, hand: List[Card]) -> int:
-        value = 0
-        aces = 0
-        
-        for card in hand:
-            if card.rank == 'A':
-                aces += 1
-            else:
-                value += card.value
-        
-        # Add aces
-        for _ in range(aces):
-            if value + 11 <= 21:
-                value += 11
-            else:
-                value += 1
-                
-        return value
+        return int(hand_value(np.array([card.value for card in hand], dtype=np.int8)))
+    
+    @property
+    def player_value(self) -> int:
+        if self._player_value is None:
+            self._player_value = self.calculate_hand_value(self.player_hand)
+        return self._player_value
+    
+    @property
+    def dealer_value(self) -> int:
+        if self._dealer_value is None:
+            self._dealer_value = self.calculate_hand_value(self.dealer_hand)
+        return self._dealer_value
+    
+    def clear_hands(self):
+        self.player_hand = []
+        self.dealer_hand = []
+        self._player_value = None
+        self._dealer_value = None
     
     def get_card_probabilities(self) -> Dict[str, float]:
         """Calculate probability of drawing each card value"""
-        remaining_cards = [card for card in self.deck]
-        total_cards = len(remaining_cards)
-        
-        probabilities = {}
-        for value in range(2, 12):  # 2-10 plus Ace (11)
-            count = sum(1 for card in remaining_cards if card.value == value)
-            probabilities[str(value)] = count / total_cards if total_cards > 0 else 0
+        if self._cached_probs is None:
+            total_cards = self.deck_top
+            probs = self.deck_comp / total_cards if total_cards > 0 else np.zeros(len(self.deck_comp))
+            # 2-10 plus Ace (11)
+            self._cached_probs = dict(zip(map(str, range(2, 12)), probs.tolist()))
             
-        return probabilities
+        return self._cached_probs
     
     def calculate_detailed_probability(self) -> Dict[str, float]:
         """Calculate detailed probabilities for different outcomes"""
-        player_value = self.calculate_hand_value(self.player_hand)
+        player_value = self.player_value
         if player_value > 21:
             return {"bust": 1.0, "win": 0.0, "push": 0.0, "lose": 0.0}
             
-        outcomes = {"bust": 0, "win": 0, "push": 0, "lose": 0}
-        simulations = 1000
-        
-        for _ in range(simulations):
-            # Run Monte Carlo simulation
-            temp_hand = self.player_hand.copy()
-            if self.game_state == "playing":
-                # Simulate drawing one more card
-                available_cards = [card for card in self.deck if card not in self.player_hand + self.dealer_hand]
-                if available_cards:
-                    temp_hand.append(random.choice(available_cards))
-                    
-            temp_value = self.calculate_hand_value(temp_hand)
+        player_base, player_aces = self._hand_parts(self.player_hand)
+        dealer_base, dealer_aces = self._hand_parts(self.dealer_hand)
+        player_hits = self.game_state == "playing"
+        
+        # Outcomes only depend on what is left in the shoe and the two hands,
+        # so reuse the last simulation until a card is drawn
+        key = (self.deck_comp.tobytes(), player_base, player_aces, dealer_base, dealer_aces, player_hits)
+        cached = self._outcome_cache.get(key)
+        if cached is not None:
+            return cached
             
-            if temp_value > 21:
-                outcomes["bust"] += 1
-            else:
-                # Simulate dealer's hand
-                temp_dealer = self.dealer_hand.copy()
-                while self.calculate_hand_value(temp_dealer) < 17:
-                    available_cards = [card for card in self.deck if card not in temp_hand + temp_dealer]
-                    if available_cards:
-                        temp_dealer.append(random.choice(available_cards))
-                        
-                dealer_value = self.calculate_hand_value(temp_dealer)
-                
-                if dealer_value > 21:
-                    outcomes["win"] += 1
-                elif temp_value > dealer_value:
-                    outcomes["win"] += 1
-                elif temp_value == dealer_value:
-                    outcomes["push"] += 1
-                else:
-                    outcomes["lose"] += 1
+        simulations = SIMULATIONS
+        
+        # Run Monte Carlo simulation, dealing from the remaining composition
+        counts = simulate_mc(
+            player_base, player_aces, dealer_base, dealer_aces, self.deck_comp, simulations,
+            player_hits, int(self._rng.integers(2**31)), get_num_threads(),
+        )
+        outcomes = dict(zip(OUTCOMES, counts.tolist()))
                     
         # Store last 10 simulation results for visualization
         self.last_simulation_results = [(k, v/simulations) for k, v in outcomes.items()]
         
-        return {k: v/simulations for k, v in outcomes.items()}
+        self._outcome_cache[key] = {k: v/simulations for k, v in outcomes.items()}
+        return self._outcome_cache[key]
+    
+    @staticmethod
+    def _hand_parts(hand: List[Card]) -> Tuple[int, int]:
+        """Sum of the non-ace cards in a hand, plus the number of aces"""
+        aces = sum(1 for card in hand if card.rank == 'A')
+        return sum(card.value for card in hand) - 11 * aces, aces
     
     def get_optimal_action(self) -> str:
         """Determine the optimal action based on basic strategy"""
-        player_value = self.calculate_hand_value(self.player_hand)
+        player_value = self.player_value
+        if player_value > 21:
+            return "Bust"
+            
         dealer_up_card = self.dealer_hand[0].value if self.dealer_hand else 0
-        
         has_ace = any(card.rank == 'A' for card in self.player_hand)
         is_pair = len(self.player_hand) == 2 and self.player_hand[0].rank == self.player_hand[1].rank
         
-        # Basic strategy logic
-        if player_value > 21:
-            return "Bust"
-        elif player_value == 21:
-            return "Stand"
-        elif has_ace:  # Soft hands
-            if player_value >= 19:
-                return "Stand"
-            elif player_value == 18:
-                return "Stand" if dealer_up_card < 9 else "Hit"
-            else:
-                return "Hit"
+        if has_ace:  # Soft hands
+            action = SOFT_STRAT[player_value, dealer_up_card]
         elif is_pair:  # Pairs
-            pair_value = self.player_hand[0].value
-            if pair_value in [8, 11]:
-                return "Split"
-            elif pair_value == 10:
-                return "Stand"
-            elif pair_value <= 7:
-                return "Hit"
+            action = PAIR_STRAT[self.player_hand[0].value, dealer_up_card]
         else:  # Hard hands
-            if player_value >= 17:
-                return "Stand"
-            elif player_value <= 11:
-                return "Hit"
-            elif 12 <= player_value <= 16:
-                return "Stand" if dealer_up_card < 7 else "Hit"
-                
-        return "Consider odds"
+            action = HARD_STRAT[player_value, dealer_up_card]
+        return ACTIONS[action]
     
     def draw_probability_panel(self):
         """Draw the probability teaching panel on the right side"""
         panel_x = 800
         panel_width = SCREEN_WIDTH - panel_x
         
-        # Draw panel background with a cleaner border
-        pygame.draw.rect(self.screen, BLACK, (panel_x, 0, panel_width, SCREEN_HEIGHT))
+        if self._panel_dirty or self._panel_surface is None:
+            if self._panel_surface is None:
+                self._panel_surface = pygame.Surface((panel_width, SCREEN_HEIGHT))
+            self.render_probability_panel(self._panel_surface)
+            self._panel_dirty = False
+        
+        self.screen.blit(self._panel_surface, (panel_x, 0))
         pygame.draw.line(self.screen, GOLD, (panel_x, 0), (panel_x, SCREEN_HEIGHT), 2)
+    
+    def render_probability_panel(self, surface: pygame.Surface):
+        """Render the panel contents onto its own surface"""
+        panel_x = 0
+        
+        # Draw panel background
+        surface.fill(BLACK)
         
         # Title with padding and underline
-        title = self.font.render("Probability Analysis", True, GOLD)
-        self.screen.blit(title, (panel_x + 30, 30))
-        pygame.draw.line(self.screen, GOLD, (panel_x + 30, 70), (panel_x + 330, 70), 1)
+        title = self._text("Probability Analysis", GOLD)
+        surface.blit(title, (panel_x + 30, 30))
+        pygame.draw.line(surface, GOLD, (panel_x + 30, 70), (panel_x + 330, 70), 1)
         
         y = 100
         
         # Current hand analysis with better spacing
         if self.player_hand:
-            player_value = self.calculate_hand_value(self.player_hand)
-            hand_text = self.font.render(f"Your Hand: {player_value}", True, WHITE)
-            self.screen.blit(hand_text, (panel_x + 30, y))
+            player_value = self.player_value
+            hand_text = self._text(f"Your Hand: {player_value}", WHITE)
+            surface.blit(hand_text, (panel_x + 30, y))
             
             # Probability bars with consistent spacing and alignment
             y += 60
             probs = self.calculate_detailed_probability()
-            for i, (outcome, prob) in enumerate(probs.items()):
-                # Bar label
-                label = self.font.render(f"{outcome.capitalize()}", True, WHITE)
-                self.screen.blit(label, (panel_x + 30, y + i*50))
-                
-                # Draw bar background
-                bar_rect = pygame.Rect(panel_x + 150, y + i*50, 300, 30)
-                pygame.draw.rect(self.screen, GRAY, bar_rect)
-                
-                # Draw filled bar
-                fill_rect = pygame.Rect(panel_x + 150, y + i*50, int(300 * prob), 30)
-                color = GOLD if outcome == "win" else BLUE if outcome == "push" else RED
-                pygame.draw.rect(self.screen, color, fill_rect)
-                
-                # Percentage label
-                percentage = self.font.render(f"{prob:.1%}", True, WHITE)
-                self.screen.blit(percentage, (panel_x + 460, y + i*50))
+            if self._bars_surface is None:
+                self._bars_surface = pygame.Surface((surface.get_width(), len(OUTCOMES) * 50), pygame.SRCALPHA)
+            # Results are cached per shoe and hand, so the same dict means the same bars
+            if probs is not self._bars_probs:
+                self.render_outcome_bars(self._bars_surface, probs)
+                self._bars_probs = probs
+            surface.blit(self._bars_surface, (panel_x, y))
         
         # Recommended action section
         y += 250
-        pygame.draw.line(self.screen, GOLD, (panel_x + 30, y), (panel_x + 330, y), 1)
+        pygame.draw.line(surface, GOLD, (panel_x + 30, y), (panel_x + 330, y), 1)
         y += 20
         action = self.get_optimal_action()
-        action_text = self.font.render("Recommended Action", True, GOLD)
-        self.screen.blit(action_text, (panel_x + 30, y))
-        action_value = self.font.render(action, True, WHITE)
-        self.screen.blit(action_value, (panel_x + 30, y + 40))
+        action_text = self._text("Recommended Action", GOLD)
+        surface.blit(action_text, (panel_x + 30, y))
+        action_value = self._text(action, WHITE)
+        surface.blit(action_value, (panel_x + 30, y + 40))
         
         # Card probabilities section
         y += 100
-        pygame.draw.line(self.screen, GOLD, (panel_x + 30, y), (panel_x + 330, y), 1)
+        pygame.draw.line(surface, GOLD, (panel_x + 30, y), (panel_x + 330, y), 1)
         y += 20
-        prob_title = self.font.render("Next Card Probabilities", True, GOLD)
-        self.screen.blit(prob_title, (panel_x + 30, y))
+        prob_title = self._text("Next Card Probabilities", GOLD)
+        surface.blit(prob_title, (panel_x + 30, y))
         
         # Two-column layout for card probabilities
         y += 40
         card_probs = self.get_card_probabilities()
-        col_width = 200
-        for i, (value, prob) in enumerate(card_probs.items()):
-            col = i // 5  # Split into two columns after 5 items
-            row = i % 5
-            x = panel_x + 30 + (col * col_width)
-            prob_text = self.small_font.render(f"Card {value}: {prob:.1%}", True, WHITE)
-            self.screen.blit(prob_text, (x, y + row * 30))
+        for (value, prob), (dx, dy) in zip(card_probs.items(), self._card_prob_offsets):
+            prob_text = self._text(f"Card {value}: {prob:.1%}", WHITE, self.small_font)
+            surface.blit(prob_text, (panel_x + dx, y + dy))
 
     
+    def render_outcome_bars(self, surface: pygame.Surface, probs: Dict[str, float]):
+        """Render the outcome labels, bars and percentages onto their own surface"""
+        surface.fill((0, 0, 0, 0))
+        for i, (outcome, prob) in enumerate(probs.items()):
+            # Bar label
+            label = self._text(f"{outcome.capitalize()}", WHITE)
+            surface.blit(label, (30, i*50))
+            
+            # Draw bar background
+            bar_rect = pygame.Rect(150, i*50, 300, 30)
+            pygame.draw.rect(surface, GRAY, bar_rect)
+            
+            # Draw filled bar
+            fill_rect = pygame.Rect(150, i*50, int(300 * prob), 30)
+            pygame.draw.rect(surface, OUTCOME_COLOR[outcome], fill_rect)
+            
+            # Percentage label
+            percentage = self._text(f"{prob:.1%}", WHITE)
+            surface.blit(percentage, (460, i*50))
+    
     def update_card_counting(self, card: Card):
         # Hi-Lo counting system
         if card.value >= 2 and card.value <= 6:
@@ -264,18 +442,26 @@ class BlackjackTeacher:
             self.running_count -= 1
             
         # Calculate true count
-        remaining_decks = len(self.deck) / 52
+        remaining_decks = self.deck_top / 52
         self.true_count = self.running_count / remaining_decks if remaining_decks > 0 else 0
     
     def draw_card(self, for_player: bool = True) -> Card:
-        if not self.deck:
+        if self.deck_top == 0:
             self.create_deck()
-        card = self.deck.pop()
+        self.deck_top -= 1
+        top = self.deck_top
+        card = Card(RANKS[self.deck_ranks[top]], SUITS[self.deck_suits[top]], int(self.deck_vals[top]))
+        self.deck_comp[card.value - 2] -= 1
+        self._cached_probs = None
+        self._panel_dirty = True
+        self._dirty = True
         self.update_card_counting(card)
         if for_player:
             self.player_hand.append(card)
+            self._player_value = None
         else:
             self.dealer_hand.append(card)
+            self._dealer_value = None
         return card
     
     def draw(self):
@@ -284,9 +470,9 @@ class BlackjackTeacher:
         
         # Header section with game info
         pygame.draw.rect(self.screen, BLACK, (0, 0, 800, 100))
-        credits_text = self.font.render(f"Credits: ${self.credits}", True, GOLD)
-        bet_text = self.font.render(f"Bet: ${self.bet}", True, GOLD)
-        count_text = self.font.render(f"True Count: {self.true_count:.1f}", True, GOLD)
+        credits_text = self._text(f"Credits: ${self.credits}", GOLD)
+        bet_text = self._text(f"Bet: ${self.bet}", GOLD)
+        count_text = self._text(f"True Count: {self.true_count:.1f}", GOLD)
         
         self.screen.blit(credits_text, (30, 30))
         self.screen.blit(bet_text, (250, 30))
@@ -295,7 +481,7 @@ class BlackjackTeacher:
         # Dealer section
         dealer_y = 150
         pygame.draw.line(self.screen, WHITE, (30, dealer_y), (770, dealer_y), 1)
-        dealer_text = self.font.render("Dealer's Hand", True, WHITE)
+        dealer_text = self._text("Dealer's Hand", WHITE)
         self.screen.blit(dealer_text, (30, dealer_y + 20))
         
         # Draw dealer's cards with better spacing
@@ -303,28 +489,28 @@ class BlackjackTeacher:
             card_x = 200 + i * 80
             pygame.draw.rect(self.screen, WHITE, (card_x, dealer_y + 60, 60, 90), 2)
             if i == 0 or self.game_state in ["dealer_turn", "game_over"]:
-                card_text = self.font.render(f"{card.rank}{card.suit}", True, WHITE)
+                card_text = self._text(f"{card.rank}{card.suit}", WHITE)
             else:
-                card_text = self.font.render("??", True, WHITE)
+                card_text = self._text("??", WHITE)
             self.screen.blit(card_text, (card_x + 10, dealer_y + 85))
         
         # Player section
         player_y = SCREEN_HEIGHT - 250
         pygame.draw.line(self.screen, WHITE, (30, player_y), (770, player_y), 1)
-        player_text = self.font.render("Your Hand", True, WHITE)
+        player_text = self._text("Your Hand", WHITE)
         self.screen.blit(player_text, (30, player_y + 20))
         
         # Draw player's cards
         for i, card in enumerate(self.player_hand):
             card_x = 200 + i * 80
             pygame.draw.rect(self.screen, WHITE, (card_x, player_y + 60, 60, 90), 2)
-            card_text = self.font.render(f"{card.rank}{card.suit}", True, WHITE)
+            card_text = self._text(f"{card.rank}{card.suit}", WHITE)
             self.screen.blit(card_text, (card_x + 10, player_y + 85))
         
         # Hand value
         if self.player_hand:
-            player_value = self.calculate_hand_value(self.player_hand)
-            value_text = self.font.render(f"Total: {player_value}", True, WHITE)
+            player_value = self.player_value
+            value_text = self._text(f"Total: {player_value}", WHITE)
             self.screen.blit(value_text, (30, player_y + 170))
         
         # Game messages
@@ -333,8 +519,8 @@ class BlackjackTeacher:
         elif self.game_state == "playing":
             msg = "Press H to hit, S to stand"
         elif self.game_state == "game_over":
-            dealer_value = self.calculate_hand_value(self.dealer_hand)
-            player_value = self.calculate_hand_value(self.player_hand)
+            dealer_value = self.dealer_value
+            player_value = self.player_value
             if player_value > 21:
                 msg = "Bust! Press SPACE to play again"
             elif dealer_value > 21 or player_value > dealer_value:
@@ -342,7 +528,7 @@ class BlackjackTeacher:
             else:
                 msg = "Dealer wins! Press SPACE to play again"
                 
-        msg_text = self.font.render(msg, True, WHITE)
+        msg_text = self._text(msg, WHITE)
         msg_rect = msg_text.get_rect(center=(400, SCREEN_HEIGHT//2))
         self.screen.blit(msg_text, msg_rect)
         
@@ -358,34 +544,43 @@ class BlackjackTeacher:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._dirty = True
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE and self.game_state in ["betting", "game_over"]:
                         if self.credits >= self.bet:
                             # Start new game
-                            self.player_hand = []
-                            self.dealer_hand = []
+                            self.clear_hands()
                             self.draw_card(True)
                             self.draw_card(True)
                             self.draw_card(False)
                             self.game_state = "playing"
+                            self._panel_dirty = True
+                            self._dirty = True
                     elif event.key == pygame.K_UP and self.game_state == "betting":
                         self.bet = min(self.bet + 100, self.credits)
+                        self._dirty = True
                     elif event.key == pygame.K_DOWN and self.game_state == "betting":
                         self.bet = max(self.bet - 100, 100)
+                        self._dirty = True
                     elif event.key == pygame.K_h and self.game_state == "playing":
                         # Hit
                         self.draw_card(True)
-                        if self.calculate_hand_value(self.player_hand) > 21:
+                        if self.player_value > 21:
                             self.credits -= self.bet
                             self.game_state = "game_over"
+                            self._panel_dirty = True
+                            self._dirty = True
                     elif event.key == pygame.K_s and self.game_state == "playing":
                         # Stand - dealer's turn
                         self.game_state = "dealer_turn"
-                        while self.calculate_hand_value(self.dealer_hand) < 17:
+                        self._panel_dirty = True
+                        self._dirty = True
+                        while self.dealer_value < 17:
                             self.draw_card(False)
                         
-                        player_value = self.calculate_hand_value(self.player_hand)
-                        dealer_value = self.calculate_hand_value(self.dealer_hand)
+                        player_value = self.player_value
+                        dealer_value = self.dealer_value
                         
                         if dealer_value > 21 or player_value > dealer_value:
                             self.credits += self.bet
@@ -393,9 +588,15 @@ class BlackjackTeacher:
                             self.credits -= self.bet
                         
                         self.game_state = "game_over"
+                        self._panel_dirty = True
+                        self._dirty = True
             
-            self.draw()
-            self.clock.tick(FPS)
+            if self._dirty:
+                self.draw()
+                self._dirty = False
+                self.clock.tick(FPS)
+            else:
+                pygame.time.wait(1000 // FPS)
         
         pygame.quit()
 